@@ -1,12 +1,18 @@
 # Standard
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.metadata import version
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
+import queue
 import re
 import sys
+import threading
 
 # Third Party
 from datasets import Dataset
@@ -18,6 +24,8 @@ from docling.datamodel.pipeline_options import (
     EasyOcrOptions,
     OcrOptions,
     PdfPipelineOptions,
+    TableFormerMode,
+    TableStructureOptions,
     TesseractOcrOptions,
 )
 from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
@@ -25,9 +33,21 @@ from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
 # First Party
 from model_formats import is_model_gguf, is_model_safetensors
 
+try:
+    # Third Party
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    # Third Party
+    from docling_core.types.doc import DoclingDocument
+
 logger = logging.getLogger(__name__)
 _DEFAULT_CHUNK_OVERLAP = 100
-SUPPORTED_FILETYPES = [".pdf", ".md"]
+SUPPORTED_FILETYPES = frozenset({".pdf", ".md"})
+# Runs of dashes or spaces in front of pipe characters in a markdown table
+_MD_CLEAN = re.compile(r"(-{2,}\|)|(\ {2,}\|)")
 
 
 def _num_tokens_from_words(num_words) -> int:
@@ -38,8 +58,51 @@ def _num_chars_from_tokens(num_tokens) -> int:
     return int(num_tokens * 4)  # 1 token ~ 4 English character
 
 
+def _hash_file(path: Path) -> str:
+    """Return a short SHA-256 content digest of a file.
+
+    On Python 3.11+ this uses hashlib.file_digest, which hashes in C and uses the
+    CPU's SHA extensions when OpenSSL (>= 3.0) supports them. Older versions
+    fall back to hashing 1 MiB blocks.
+    """
+    with open(path, "rb") as f:
+        if sys.version_info >= (3, 11):
+            digest = hashlib.file_digest(f, "sha256")
+        else:
+            digest = hashlib.sha256()
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _dump_json_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _md_clean_sub(match: re.Match) -> str:
+    return "-|" if match.group(1) else " |"
+
+
 def resolve_ocr_options(
     docling_model_path: Optional[Path] = None,
+) -> Optional[OcrOptions]:
+    """Return OCR options for the first available OCR engine, or None.
+
+    The availability probe is cached per model path, so only the first call
+    pays for loading the OCR models.
+    """
+    ocr_options = _probe_ocr_options(docling_model_path)
+    if ocr_options is None:
+        return None
+    return ocr_options.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_ocr_options(
+    docling_model_path: Optional[Path] = None,
 ) -> Optional[OcrOptions]:
     # Declare ocr_options explicitly as Optional[OcrOptions]
     ocr_options: Optional[OcrOptions] = None
@@ -69,19 +132,25 @@ def resolve_ocr_options(
             confidence_threshold=0.5,
             model_storage_directory=str(docling_model_path),
             recog_network="standard",
-            download_enabled=True,
+            # avoid network IO while probing, re-enabled on the returned options
+            download_enabled=False,
         )
         # triggers torch loading, import lazily
         # pylint: disable=import-outside-toplevel
         # Third Party
         from docling.models.easyocr_model import EasyOcrModel
 
-        _ = EasyOcrModel(
-            enabled=True,
-            artifacts_path=None,
-            options=ocr_options,
-            accelerator_options=AcceleratorOptions(device=AcceleratorDevice.CPU),
-        )
+        try:
+            _ = EasyOcrModel(
+                enabled=True,
+                artifacts_path=None,
+                options=ocr_options,
+                accelerator_options=AcceleratorOptions(device=AcceleratorDevice.CPU),
+            )
+        except FileNotFoundError:
+            # EasyOCR is installed but its models are not downloaded yet
+            logger.info("EasyOCR models not found, they will be downloaded on use.")
+        ocr_options.download_enabled = True
         return ocr_options
     except ImportError:
         # no easyocr either, so don't use any OCR
@@ -93,15 +162,89 @@ def resolve_ocr_options(
 
 def split_docs_by_filetype(document_paths: List[Path]) -> Dict[str, List[Path]]:
     """Split document paths into a dict of lists based on their file extension."""
-    document_dict = defaultdict(list)
+    # Buckets are created in first-seen order, independent of set iteration order
+    document_dict: Dict[str, List[Path]] = {}
     for path in document_paths:
         filetype = path.suffix
         if filetype not in SUPPORTED_FILETYPES:
             raise ValueError(f"Provided unsupported filetype {filetype}")
 
+        if filetype not in document_dict:
+            document_dict[filetype] = []
         document_dict[filetype].append(path)
 
-    return dict(document_dict)
+    return document_dict
+
+
+def _convert_and_chunk_batch(
+    document_paths: List[Path],
+    tokenizer_model_name: str | Path,
+    docling_model_path: Optional[Path],
+    chunk_word_count: int,
+    device: Optional[AcceleratorDevice],
+    enable_ocr: bool,
+    table_mode: str,
+    cache_dir: Optional[Path],
+) -> List:
+    """Convert and chunk a batch of documents inside a worker process.
+
+    Each worker builds its own converter and tokenizer so that no torch models
+    have to be pickled across process boundaries.
+    """
+    chunker = DocumentChunker(
+        document_paths=document_paths,
+        tokenizer_model_name=tokenizer_model_name,
+        docling_model_path=docling_model_path,
+        chunk_word_count=chunk_word_count,
+        device=device,
+        num_threads=1,  # avoid oversubscribing cores across workers
+        enable_ocr=enable_ocr,
+        table_mode=table_mode,
+        cache_dir=cache_dir,
+    )
+    return chunker.chunk_documents(num_workers=1)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tokenizer_cached(model_path_str: str):
+    """Load a tokenizer once per model path, see DocumentChunker.create_tokenizer."""
+    # import lazily to not load transformers at top level
+    # pylint: disable=import-outside-toplevel
+    # Third Party
+    from transformers import AutoTokenizer
+
+    model_path = Path(model_path_str)
+    error_info_message = (
+        "Please run `ilab model download {download_args}` and try again"
+    )
+    try:
+        if is_model_safetensors(model_path):
+            error_info_message = error_info_message.format(
+                download_args=f"--repository {model_path}"
+            )
+            tokenizer = AutoTokenizer.from_pretrained(model_path)
+
+        elif is_model_gguf(model_path):
+            model_dir, model_filename = model_path.parent, model_path.name
+            error_info_message = error_info_message.format(
+                download_args=f"--repository {model_dir} --filename {model_filename}"
+            )
+            tokenizer = AutoTokenizer.from_pretrained(
+                model_dir, gguf_file=model_filename
+            )
+
+        else:
+            error_info_message = "Please provide a path to a valid model format. For help on downloading models, run `ilab model download --help`."
+            raise ValueError()
+
+        logger.info(f"Successfully loaded tokenizer from: {model_path}")
+        return tokenizer
+
+    except (OSError, ValueError) as e:
+        logger.error(
+            f"Failed to load tokenizer as no valid model was not found at {model_path}. {error_info_message}"
+        )
+        raise e
 
 
 class DocumentChunker:  # pylint: disable=too-many-instance-attributes
@@ -112,6 +255,11 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
         docling_model_path: Optional[Path] = None,
         server_ctx_size: int = 4096,
         chunk_word_count: int = 1024,
+        device: Optional[AcceleratorDevice] = None,
+        num_threads: Optional[int] = None,
+        enable_ocr: bool = False,
+        table_mode: str = "fast",
+        cache_dir: Optional[Path] = None,
     ):
         if not document_paths:
             raise ValueError("Provided empty list of documents")
@@ -124,18 +272,42 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
         # We know there is only 1 key, value pair, so we take the first
         self.document_filetype, self.document_paths = next(iter(document_dict.items()))
         self.docling_model_path = docling_model_path
-        self.converter = self._init_docling_converter()
+        self.device = AcceleratorDevice(device) if device is not None else None
+        self.num_threads = num_threads
+        self.enable_ocr = enable_ocr
+        self.table_mode = TableFormerMode(table_mode)
+        # Resolve the models up front so worker processes don't each download them
+        self._init_docling_models()
 
         self.server_ctx_size = server_ctx_size
         self.chunk_word_count = chunk_word_count
-        self.tokenizer = self.create_tokenizer(tokenizer_model_name)
-
-    def _init_docling_converter(self):
-        """Initialize docling converter with filetype-specific configurations"""
+        self.tokenizer_model_name = tokenizer_model_name
+        self._hybrid_chunker = None
+        # Converted documents are cached here when set, entries are never evicted
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    @functools.cached_property
+    def converter(self):
+        """Docling converter, built on first use so multi-process runs skip it"""
+        return self._init_docling_converter()
+
+    @functools.cached_property
+    def tokenizer(self):
+        """Tokenizer, loaded on first use so multi-process runs skip it"""
+        return self.create_tokenizer(self.tokenizer_model_name)
+
+    @functools.cached_property
+    def _ocr_options(self) -> Optional[OcrOptions]:
+        """OCR options applied to the converter, None if disabled or unavailable"""
+        if not self.enable_ocr:
+            return None
+        return resolve_ocr_options(docling_model_path=self.docling_model_path)
+
+    def _init_docling_models(self):
+        """Download the docling models if no local path was provided"""
         # triggers torch loading, import lazily
         # pylint: disable=import-outside-toplevel
         # Third Party
-        from docling.document_converter import DocumentConverter, PdfFormatOption
         from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
 
         if self.docling_model_path is None:
@@ -144,20 +316,39 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
         else:
             logger.info("Found the docling models")
 
+    def _init_docling_converter(self):
+        """Initialize docling converter with filetype-specific configurations"""
+        # triggers torch loading, import lazily
+        # pylint: disable=import-outside-toplevel
+        # Third Party
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
         pipeline_options = PdfPipelineOptions(
             artifacts_path=self.docling_model_path,
             do_ocr=False,
+            table_structure_options=TableStructureOptions(mode=self.table_mode),
         )
 
+        # Only override what the caller set, AcceleratorOptions otherwise picks up
+        # DOCLING_DEVICE, DOCLING_NUM_THREADS and OMP_NUM_THREADS (default AUTO)
+        accelerator_kwargs = {}
+        if self.device is not None:
+            accelerator_kwargs["device"] = self.device
+        if self.num_threads is not None:
+            accelerator_kwargs["num_threads"] = self.num_threads
+
         # deactivate MPS acceleration on Github CI
         if os.getenv("CI") and sys.platform == "darwin":
+            accelerator_kwargs["device"] = AcceleratorDevice.CPU
+
+        if accelerator_kwargs:
             pipeline_options.accelerator_options = AcceleratorOptions(
-                device=AcceleratorDevice.CPU
+                **accelerator_kwargs
             )
-        ocr_options = resolve_ocr_options(docling_model_path=self.docling_model_path)
-        if ocr_options is not None:
+
+        if self._ocr_options is not None:
             pipeline_options.do_ocr = True
-            pipeline_options.ocr_options = ocr_options
+            pipeline_options.ocr_options = self._ocr_options
 
         return DocumentConverter(
             format_options={
@@ -165,39 +356,194 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
             }
         )
 
-    def chunk_documents(self) -> List:
+    def chunk_documents(self, num_workers: int = 1) -> List:
         """Split a list of documents into chunks
 
+        Documents are sharded across worker processes, each holding its own
+        converter, when more than one worker is requested. Workers are spawned
+        rather than forked, so they never inherit an initialized CUDA context,
+        and scripts using them must run under an `if __name__ == "__main__":` guard.
+        Each worker loads its own docling models and tokenizer.
+        Args:
+            num_workers (int): Number of worker processes to convert documents with.
+                               Default is 1, converting in the calling process.
         Returns:
             List: a list of chunks from the documents
         """
+        num_workers = min(num_workers, len(self.document_paths))
+
+        if num_workers > 1:
+            batch_size = -(-len(self.document_paths) // num_workers)
+            batches = [
+                self.document_paths[i : i + batch_size]
+                for i in range(0, len(self.document_paths), batch_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=len(batches),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _convert_and_chunk_batch,
+                        batch,
+                        self.tokenizer_model_name,
+                        self.docling_model_path,
+                        self.chunk_word_count,
+                        self.device,
+                        self.enable_ocr,
+                        self.table_mode.value,
+                        self._cache_dir,
+                    )
+                    for batch in batches
+                ]
+                all_chunks = []
+                # Collect in submission order to keep chunks in document order
+                for future in futures:
+                    all_chunks.extend(future.result())
+            return all_chunks
+
         # Move docling_core import inside method where it's used to avoid importing transformers at top level
         # pylint: disable=import-outside-toplevel
         # Third Party
         from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
 
-        parsed_documents = self.converter.convert_all(self.document_paths)
+        if self._hybrid_chunker is None:
+            self._hybrid_chunker = HybridChunker(
+                tokenizer=self.tokenizer, max_tokens=500
+            )
+        chunker = self._hybrid_chunker
+
+        num_tokens_per_doc = _num_tokens_from_words(self.chunk_word_count)
+        chunk_size = _num_chars_from_tokens(num_tokens_per_doc)
+
+        # Convert on a background thread so conversion overlaps with chunking,
+        # the bounded queue keeps at most a few converted documents in memory
+        parsed_documents: queue.Queue = queue.Queue(maxsize=4)
+        stop = threading.Event()
         all_chunks = []
-        for conversion_result in parsed_documents:
-            doc = conversion_result.document
-            chunker = HybridChunker(tokenizer=self.tokenizer, max_tokens=500)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            producer = executor.submit(self._produce_documents, parsed_documents, stop)
             try:
-                chunk_iter = chunker.chunk(dl_doc=doc)
-                chunks = [chunker.serialize(chunk=chunk) for chunk in chunk_iter]
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error(
-                    f"Error chunking document {conversion_result.input.file}: {e}"
-                )
-                chunks = []
-
-            fused_texts = self.fuse_texts(chunks, 200)
-            num_tokens_per_doc = _num_tokens_from_words(self.chunk_word_count)
-            chunk_size = _num_chars_from_tokens(num_tokens_per_doc)
-            final_chunks = chunk_markdowns(fused_texts, chunk_size)
-            all_chunks.extend(final_chunks)
-
+                while (item := parsed_documents.get()) is not None:
+                    path, doc = item
+                    try:
+                        chunk_iter = chunker.chunk(dl_doc=doc)
+                        chunks = list(map(chunker.serialize, chunk_iter))
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.error(f"Error chunking document {path}: {e}")
+                        chunks = []
+
+                    # Threshold is in estimated tokens (words * 1.3)
+                    fused_texts = self.fuse_texts(chunks, 200)
+                    final_chunks = chunk_markdowns(fused_texts, chunk_size)
+                    all_chunks.extend(final_chunks)
+            finally:
+                stop.set()
+                # Drain the queue so a producer blocked on a full queue can exit
+                while not producer.done():
+                    try:
+                        parsed_documents.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+        # Re-raise any conversion error from the producer thread
+        producer.result()
         return all_chunks
 
+    def _produce_documents(self, parsed_documents: queue.Queue, stop: threading.Event):
+        """Put converted documents on the queue, followed by a None sentinel"""
+        documents = self._convert_documents()
+        try:
+            # Check for a stop before requesting the next document, as each
+            # request can run a full conversion
+            while not stop.is_set():
+                try:
+                    item = next(documents)
+                except StopIteration:
+                    break
+                parsed_documents.put(item)
+        finally:
+            documents.close()
+            parsed_documents.put(None)
+
+    @functools.cached_property
+    def _cache_options_key(self) -> str:
+        """Digest of everything besides the input file that affects conversion output"""
+        options = {
+            "docling": version("docling"),
+            "docling-core": version("docling-core"),
+            "docling_model_path": str(self.docling_model_path),
+            "table_mode": self.table_mode.value,
+            # The OCR engine actually applied, not just the enable_ocr flag
+            "ocr": type(self._ocr_options).__name__ if self._ocr_options else None,
+        }
+        return hashlib.sha256(
+            json.dumps(options, sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    def _cache_path(self, path: Path) -> Path:
+        """Return the cache file for a document, keyed on content and options"""
+        return self._cache_dir / f"{_hash_file(path)}-{self._cache_options_key}.json"
+
+    def _write_cache(self, cache_path: Path, conversion_result: ConversionResult):
+        """Write a successful conversion to the cache"""
+        # pylint: disable=import-outside-toplevel
+        # Third Party
+        from docling.document_converter import ConversionStatus
+
+        if conversion_result.status != ConversionStatus.SUCCESS:
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see partial JSON
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as fp:
+            fp.write(_dump_json_bytes(conversion_result.document.export_to_dict()))
+        os.replace(tmp_path, cache_path)
+
+    def _convert_documents(self) -> Iterator[Tuple[Path, "DoclingDocument"]]:
+        """Convert documents, reusing cached Docling JSON for previously seen files
+
+        Caching is skipped when no cache directory was configured.
+        Yields:
+            Tuple[Path, DoclingDocument]: each input path with its converted document,
+                in input order.
+        """
+        # pylint: disable=import-outside-toplevel
+        # Third Party
+        from docling_core.types.doc import DoclingDocument
+
+        if self._cache_dir is None:
+            for path, conversion_result in zip(
+                self.document_paths, self.converter.convert_all(self.document_paths)
+            ):
+                yield path, conversion_result.document
+            return
+
+        cache_paths = {path: self._cache_path(path) for path in self.document_paths}
+        hits = {path for path, cached in cache_paths.items() if cached.exists()}
+        misses = [path for path in self.document_paths if path not in hits]
+        logger.info(f"Found {len(hits)} cached docling conversions")
+
+        converted = iter(self.converter.convert_all(misses) if misses else [])
+        for path in self.document_paths:
+            cache_path = cache_paths[path]
+            if path in hits:
+                try:
+                    document = DoclingDocument.model_validate_json(
+                        cache_path.read_bytes()
+                    )
+                    yield path, document
+                    continue
+                except (OSError, ValueError) as e:
+                    # pydantic's ValidationError is a ValueError, reconvert instead
+                    logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+                    conversion_result = self.converter.convert(path)
+            else:
+                conversion_result = next(converted)
+
+            self._write_cache(cache_path, conversion_result)
+            yield path, conversion_result.document
+
     def _path_validator(self, path) -> Path:
         """
         Validate the path and return a Path object.
@@ -213,26 +559,43 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
         return path
 
     def fuse_texts(
-        self, text_list: List, short_length_threshold: int = 130
+        self,
+        text_list: List,
+        short_length_threshold: int = 130,
+        use_exact_tokens: bool = False,
     ) -> List[str]:
         """
         Fuse short texts with preceding longer texts if their token count is below the threshold.
         Args:
             text_list (list): List of text chunks to process.
             short_length_threshold (int): The token count threshold for determining short texts.
-                                      Default is 130, tuned specifically for the Mixtral tokenizer.
-                                      Update this value if changing the tokenizer model.
+                                      By default it is compared against an estimate of
+                                      words * 1.3, independent of the tokenizer model.
+                                      Default is 130.
+            use_exact_tokens (bool): Count tokens with the tokenizer instead of estimating
+                                      them from the word count. The threshold then
+                                      depends on the tokenizer model. Default is False.
         Returns:
             list: List of fused texts.
         """
         fused_texts: List[str] = []
         previous_long_text = ""
 
-        for text in text_list:
-            token_count = self.get_token_count(
-                text, self.tokenizer
-            )  # Use tokenizer for token count
+        if use_exact_tokens and text_list:
+            # Tokenize all texts in a single batched call rather than once per text
+            token_counts = self.tokenizer(
+                text_list,
+                add_special_tokens=False,
+                return_length=True,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+            )["length"]
+        else:
+            token_counts = [
+                _num_tokens_from_words(len(text.split())) for text in text_list
+            ]
 
+        for text, token_count in zip(text_list, token_counts):
             if token_count <= short_length_threshold and previous_long_text:
                 # Append the short text to the last long text
                 fused_texts[-1] += "\n\n" + text
@@ -254,44 +617,8 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
         Returns:
             AutoTokenizer: The tokenizer instance.
         """
-        # import lazily to not load transformers at top level
-        # pylint: disable=import-outside-toplevel
-        # Third Party
-        from transformers import AutoTokenizer
-
-        if not isinstance(model_path, Path):
-            model_path = Path(model_path)
-        error_info_message = (
-            "Please run `ilab model download {download_args}` and try again"
-        )
-        try:
-            if is_model_safetensors(model_path):
-                error_info_message = error_info_message.format(
-                    download_args=f"--repository {model_path}"
-                )
-                tokenizer = AutoTokenizer.from_pretrained(model_path)
-
-            elif is_model_gguf(model_path):
-                model_dir, model_filename = model_path.parent, model_path.name
-                error_info_message = error_info_message.format(
-                    download_args=f"--repository {model_dir} --filename {model_filename}"
-                )
-                tokenizer = AutoTokenizer.from_pretrained(
-                    model_dir, gguf_file=model_filename
-                )
-
-            else:
-                error_info_message = "Please provide a path to a valid model format. For help on downloading models, run `ilab model download --help`."
-                raise ValueError()
-
-            logger.info(f"Successfully loaded tokenizer from: {model_path}")
-            return tokenizer
-
-        except (OSError, ValueError) as e:
-            logger.error(
-                f"Failed to load tokenizer as no valid model was not found at {model_path}. {error_info_message}"
-            )
-            raise e
+        # Tokenizers are cached per model path, treat the result as read-only
+        return _load_tokenizer_cached(str(model_path))
 
     def get_token_count(self, text, tokenizer):
         """
@@ -328,8 +655,8 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
                 doc_filename = doc.input.file.stem
 
                 # Export Deep Search document JSON format:
-                with (docling_artifacts_path / f"{doc_filename}.json").open("w") as fp:
-                    fp.write(json.dumps(doc.document.export_to_dict()))
+                with (docling_artifacts_path / f"{doc_filename}.json").open("wb") as fp:
+                    fp.write(_dump_json_bytes(doc.document.export_to_dict()))
 
                 # Export Markdown format:
                 with (docling_artifacts_path / f"{doc_filename}.md").open("w") as fp:
@@ -345,6 +672,18 @@ class DocumentChunker:  # pylint: disable=too-many-instance-attributes
         return docling_artifacts_path
 
 
+@functools.lru_cache(maxsize=8)
+def _get_md_splitter(
+    chunk_size: int, chunk_overlap: int
+) -> RecursiveCharacterTextSplitter:
+    # Using Markdown as default, document-specific chunking will be implemented in separate pr.
+    return RecursiveCharacterTextSplitter.from_language(
+        language=Language.MARKDOWN,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    )
+
+
 def chunk_markdowns(documents: List | Dataset, chunk_size) -> Dataset:
     """
     Iterates over the documents and splits them into chunks based on the word count provided by the user.
@@ -361,19 +700,14 @@ def chunk_markdowns(documents: List | Dataset, chunk_size) -> Dataset:
     # chunk_size = _num_chars_from_tokens(no_tokens_per_doc)
     chunk_overlap = _DEFAULT_CHUNK_OVERLAP
 
-    # Using Markdown as default, document-specific chunking will be implemented in separate pr.
-    text_splitter = RecursiveCharacterTextSplitter.from_language(
-        language=Language.MARKDOWN,
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-    )
+    text_splitter = _get_md_splitter(chunk_size, chunk_overlap)
 
     # Determine file type for heuristics, default with markdown
     for docs in documents:
-        # Use regex to remove unnecessary dashes in front of pipe characters in a markdown table.
-        docs = re.sub(r"-{2,}\|", "-|", docs)
-        # Remove unnecessary spaces in front of pipe characters in a markdown table.
-        docs = re.sub(r"\  +\|", " |", docs)
+        # Remove unnecessary dashes and spaces in front of pipe characters in a markdown table.
+        # Substring search is much cheaper than a regex scan, so skip documents without tables.
+        if "-|" in docs or " |" in docs:
+            docs = _MD_CLEAN.sub(_md_clean_sub, docs)
         temp = text_splitter.create_documents([docs])
         content.extend([item.page_content for item in temp])
     return content
\ No newline at end of file
@@ -1,12 +1,28 @@
+import logging
+import multiprocessing
+import os
+import subprocess
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Union
+from typing import List, Tuple, Union
 from taxonomy import LeafNode, SkillLeafNode, KnowledgeLeafNode
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+logger = logging.getLogger(__name__)
+
+# Same as chunking.SUPPORTED_FILETYPES, kept here to avoid importing docling
+_DOCUMENT_FILETYPES = frozenset({".pdf", ".md"})
+
 
 def _read_qna_file(path: Path):
-    with open(path, encoding="utf-8") as f:
-        contents = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        contents = yaml.load(f.read(), Loader=_YLoader)
     
     task_description = contents.get("task_description")
     document_outline = contents.get("document_outline")
@@ -33,12 +49,99 @@ def _read_qna_file(path: Path):
     )
 
 
+def _changed_qna_files(repo_path: Path, base: str) -> Tuple[Path, List[Path]]:
+    """List the qna.yaml files under `repo_path` changed since branching from `base`.
+
+    Returns:
+        Tuple[Path, List[Path]]: the repository top level and the changed qna files.
+    """
+
+    def _git(cwd: Path, *args: str) -> str:
+        result = subprocess.run(
+            ["git", "-C", str(cwd), *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    def _git_paths(cwd: Path, *args: str) -> List[str]:
+        # -z output is NUL separated and never quotes non-ASCII paths
+        return [name for name in _git(cwd, *args, "-z").split("\0") if name]
+
+    # Run from the top level so both commands report paths relative to the same root
+    toplevel = Path(_git(repo_path, "rev-parse", "--show-toplevel").strip())
+    # Diff against the merge-base so changes made only on `base` are not reported
+    merge_base = _git(toplevel, "merge-base", base, "HEAD").strip()
+    changed = _git_paths(toplevel, "diff", "--name-only", merge_base)
+    untracked = _git_paths(toplevel, "ls-files", "--others", "--exclude-standard")
+
+    repo_path = repo_path.resolve()
+    qna_files = []
+    for name in dict.fromkeys(changed + untracked):
+        path = toplevel / name
+        if (
+            path.name == "qna.yaml"
+            and path.is_file()
+            and path.resolve().is_relative_to(repo_path)
+        ):
+            qna_files.append(path)
+    return toplevel, qna_files
+
+
 def ingest_taxonomy(
     repo_path: str | Path,
     base: str = "origin/main"
 ) -> List[LeafNode]:
-    # TODO
-    ...
+    """Ingest the leaf nodes that changed in a taxonomy repo relative to `base`.
+
+    Knowledge leaves are independent of each other, so they are ingested in
+    parallel worker processes. Workers are spawned, so scripts calling this must
+    do so under an `if __name__ == "__main__":` guard.
+
+    Only knowledge leaves with documents stored next to their `qna.yaml` are
+    returned. Skill leaves and documents referenced from the `qna.yaml`
+    `document` section are skipped with a warning.
+
+    Args:
+        repo_path (Path): The path to a taxonomy git repository.
+        base (str): The git ref to diff the taxonomy against.
+
+    Returns:
+        List[LeafNode]: The processed leaf nodes.
+    """
+    repo_path = Path(repo_path).expanduser()
+    toplevel, qna_files = _changed_qna_files(repo_path, base)
+
+    leaf_dirs = []
+    for qna_file in qna_files:
+        if qna_file.relative_to(toplevel).parts[0] == "knowledge":
+            leaf_dirs.append(qna_file.parent)
+        else:
+            logger.warning(
+                f"Skipping skill leaf {qna_file}, skills are not supported yet"
+            )
+
+    if not leaf_dirs:
+        return []
+
+    max_workers = min(len(leaf_dirs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        nodes = list(executor.map(ingest_knowledge_directory, leaf_dirs, chunksize=8))
+
+    knowledge_nodes = []
+    for node in nodes:
+        if node.documents:
+            knowledge_nodes.append(node)
+        else:
+            logger.warning(
+                f"Skipping knowledge leaf {node.path}, no local documents found. "
+                "Documents from the qna.yaml `document` section are not supported yet."
+            )
+
+    return knowledge_nodes
 
 
 def ingest_skill_qna_file(filepath: Path) -> SkillLeafNode:
@@ -57,13 +160,25 @@ def ingest_knowledge_directory(dirpath: Union[Path, str]) -> KnowledgeLeafNode:
         KnowledgeLeafNode: The processed knowledge node.
     """
     dirpath = Path(dirpath).expanduser()
-    files = {f for f in dirpath.iterdir() if f.is_file()}
 
-    qna_file = dirpath / "qna.yaml"
-    if qna_file not in files:
+    # scandir entries carry their file type, avoiding a stat call per file
+    qna_file = None
+    documents = []
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            path = Path(entry.path)
+            if entry.name == "qna.yaml":
+                qna_file = path
+            elif path.suffix in _DOCUMENT_FILETYPES:
+                documents.append(path)
+            else:
+                # e.g. the attribution.txt found in taxonomy knowledge leaves
+                logger.debug(f"Ignoring non-document file {path}")
+
+    if qna_file is None:
         raise ValueError("Expected 'qna.yaml' in knowledge directory.")
-    
-    documents = list(files - {qna_file})
 
     _, document_outline, domain, seed_data = _read_qna_file(qna_file)
 
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from datasets import Dataset
 
 
 @dataclass
@@ -30,37 +33,56 @@ class KnowledgeLeafNode(LeafNode):
         self.seed_data = self._validate_seed_data(seed_data)
     
     def _validate_seed_data(self, seed_data):
+        # Like the asserts this replaces, validation is skipped under `python -O`
+        if not __debug__:
+            return seed_data
         for icl in seed_data:
-            assert isinstance(icl["context"], str)
+            if type(icl["context"]) is not str:
+                raise TypeError("Expected seed example context to be a string.")
             for qna in icl["questions_and_answers"]:
-                for k in ("question", "answer"):
-                    assert qna[k]
-                    assert isinstance(qna[k], str)
+                q, a = qna["question"], qna["answer"]
+                if not q or type(q) is not str:
+                    raise ValueError("Expected a non-empty string question.")
+                if not a or type(a) is not str:
+                    raise ValueError("Expected a non-empty string answer.")
         return seed_data
 
-    def to_samples(self, document_chunks):
-        chunked_dataset = []
+    def to_samples(self, document_chunks) -> "Dataset":
+        # import lazily to not load datasets/pyarrow when only ingesting
+        # pylint: disable=import-outside-toplevel
+        from datasets import Dataset
+
+        # Build the dataset column by column rather than as one dict per record
+        num_icl = len(self.seed_data)
+        n = len(document_chunks) * num_icl
+        max_qna = max(
+            (len(icl["questions_and_answers"]) for icl in self.seed_data), default=0
+        )
+
+        columns = {
+            "document": [None] * n,
+            "icl_document": [None] * n,
+            "document_outline": [self.document_outline] * n,
+            "domain": [self.domain] * n,
+            "leaf_node_type": ["knowledge"] * n,
+            "leaf_node_path": [str(self.path)] * n,
+        }
+        queries = [[None] * n for _ in range(max_qna)]
+        responses = [[None] * n for _ in range(max_qna)]
 
-        for chunk in document_chunks:
-            for icl in self.seed_data:
-                record = {
-                    "document": chunk,
-                    "icl_document": icl["context"],
-                    "document_outline": self.document_outline,
-                    "domain": self.domain,
-                    "leaf_node_type": "knowledge",
-                    "leaf_node_path": str(self.path),
-                }
+        for ci, chunk in enumerate(document_chunks):
+            for si, icl in enumerate(self.seed_data):
+                idx = ci * num_icl + si
+                columns["document"][idx] = chunk
+                columns["icl_document"][idx] = icl["context"]
 
                 for i, qna in enumerate(icl["questions_and_answers"]):
-                    record.update(
-                        {
-                            f"icl_query_{i+1}": qna["question"],
-                            f"icl_response_{i+1}": qna["answer"],
-                        }
-                    )
+                    queries[i][idx] = qna["question"]
+                    responses[i][idx] = qna["answer"]
 
-                chunked_dataset.append(record)
+        for i in range(max_qna):
+            columns[f"icl_query_{i+1}"] = queries[i]
+            columns[f"icl_response_{i+1}"] = responses[i]
 
-        return chunked_dataset
+        return Dataset.from_dict(columns)
         